@@ -1,50 +1,54 @@
-import os
-import json
+from lang_files import PASSED_DIR, iter_patches, language_path, load_language, record_applied, save_language
+
+
+def apply_patch(lang_data, edits):
+    """Apply one submission's edits to *lang_data* in place and return the update count."""
+    updated = 0
+    for key, new_val in edits.items():
+        if key in lang_data and lang_data[key] != new_val:
+            lang_data[key] = new_val
+            updated += 1
+
+    # Handle FIND/REPLACE edits
+    for key, val in edits.items():
+        if key.startswith("FIND: ") and val.startswith("REPLACE: "):
+            find_text = key[len("FIND: "):]
+            replace_text = val[len("REPLACE: "):]
+            for k in lang_data:
+                if isinstance(lang_data[k], str) and find_text in lang_data[k]:
+                    lang_data[k] = lang_data[k].replace(find_text, replace_text)
+                    updated += 1
 
-def apply_changes():
-    # Existing code...
+    return updated
 
-    passed_dir = "../passed_changes"
-    language_dir = ".."  # or adjust if language files are elsewhere
 
-    for filename in os.listdir(passed_dir):
-        if filename.endswith(".json"):
-            path = os.path.join(passed_dir, filename)
-            with open(path, "r", encoding="utf-8") as f:
-                patch = json.load(f)
+def apply_changes(passed_dir=PASSED_DIR):
+    applied = []
+    for path, patch in iter_patches(passed_dir):
+        lang = patch.get("language")
+        edits = patch.get("edits", {})
 
-            lang = patch.get("language")
-            edits = patch.get("edits", {})
+        lang_file_path = language_path(lang)
+        if not lang_file_path.exists():
+            print(f"Language file not found for '{lang}': {lang_file_path}")
+            continue
 
-            lang_file_path = os.path.join(language_dir, f"{lang}.json")
-            if not os.path.exists(lang_file_path):
-                print(f"Language file not found for '{lang}': {lang_file_path}")
-                continue
+        lang_data = load_language(lang)
+        updated = apply_patch(lang_data, edits)
 
-            with open(lang_file_path, "r", encoding="utf-8") as f:
-                lang_data = json.load(f)
+        if updated > 0:
+            save_language(lang)
+            print(f"Applied {updated} updates in {lang_file_path}")
+        else:
+            print(f"No updates needed for {lang_file_path}")
+        applied.append(path.name)
+
+    record_applied(applied)
+
+
+def main():
+    apply_changes()
 
-            updated = 0
-            for key, new_val in edits.items():
-                if key in lang_data and lang_data[key] != new_val:
-                    lang_data[key] = new_val
-                    updated += 1
 
-            # Handle FIND/REPLACE edits
-            for key, val in edits.items():
-                if key.startswith("FIND: ") and val.startswith("REPLACE: "):
-                    find_text = key[len("FIND: "):]
-                    replace_text = val[len("REPLACE: "):]
-                    for k in lang_data:
-                        if isinstance(lang_data[k], str) and find_text in lang_data[k]:
-                            lang_data[k] = lang_data[k].replace(find_text, replace_text)
-                            updated += 1
-
-            if updated > 0:
-                with open(lang_file_path, "w", encoding="utf-8") as f:
-                    json.dump(lang_data, f, ensure_ascii=False, indent=4)
-                print(f"Applied {updated} updates in {lang_file_path}")
-            else:
-                print(f"No updates needed for {lang_file_path}")
-
-apply_changes()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
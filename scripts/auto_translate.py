@@ -9,17 +9,25 @@ the dependency.
 
 import os
 import json
-import requests
-from tqdm import tqdm
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, NamedTuple, Optional
+
+from lang_files import CHUNKS_DIR, TRANSLATED_CHUNKS_DIR
 
 # ─── Configuration ──────────────────────────────────────────────────────────
 GEMMA_URL = "http://localhost:1234/v1/chat/completions"
 MODEL_NAME = "gemma-3-27b-it"
 TEMPERATURE = 0.7              
+CONCURRENCY = 1                # chunks translated in parallel
+RETRIES = 0                    # extra attempts for a failed or non-JSON reply
+REQUEST_TIMEOUT = None         # seconds; None waits forever
 
 # ────────────────────────────────────────────────────────────────────────────
 
-def send_translation_request(json_payload: str, language: str) -> str:
+def send_translation_request(json_payload: str, language: str,
+                             url: str = GEMMA_URL, verbose: bool = True,
+                             timeout: Optional[float] = REQUEST_TIMEOUT) -> str:
 
     SYSTEM_PROMPT = f"""Your job is to translate text of a video game from English to another language. Output nothing else other than the translated text. For context, the text is from a card game with a variety of keywords that need to be consistent throughout the translation. Translate the keywords to the other language and maintain them throughout. Important keywords include:
 
@@ -57,11 +65,14 @@ Please translate the attached json data from English to {language}. The keys sho
         "stream": True
     }
 
-    response = requests.post(GEMMA_URL, json=req_body, stream=True)
+    import requests
+
+    response = requests.post(url, json=req_body, stream=True, timeout=timeout)
     response.raise_for_status()
 
     translated_buffer = []        # hold incoming token fragments
-    print("\n  ↳ streaming tokens...", flush=True)
+    if verbose:
+        print("\n  ↳ streaming tokens...", flush=True)
     for line in response.iter_lines():
         if not line:
             continue
@@ -81,20 +92,61 @@ Please translate the attached json data from English to {language}. The keys sho
             
             #print(token, end="", flush=True)   # live feedback
 
-    print()   # newline after stream
+    if verbose:
+        print()   # newline after stream
     return "".join(translated_buffer).strip()
 
-import time
+
+class ChunkResult(NamedTuple):
+    text: Optional[str]   # last reply, None if every attempt raised
+    ok: bool              # text parsed as a JSON object
+    errors: List[str]     # "ExceptionType: message" for each failed attempt
+    seconds: float
+
+
+def translate_chunk(chunk_text: str, language: str, url: str = GEMMA_URL,
+                    retries: int = RETRIES, timeout: Optional[float] = REQUEST_TIMEOUT,
+                    verbose: bool = True) -> ChunkResult:
+    """Translate one chunk, retrying on errors and on replies that aren't a JSON object."""
+    start = time.perf_counter()
+    text = None
+    errors = []
+    for _ in range(retries + 1):
+        try:
+            text = send_translation_request(chunk_text, language, url=url,
+                                            verbose=verbose, timeout=timeout)
+        except Exception as exc:
+            errors.append(f"{exc.__class__.__name__}: {exc}")
+            continue
+        try:
+            if isinstance(json.loads(text), dict):
+                return ChunkResult(text, True, errors, time.perf_counter() - start)
+            errors.append("ValueError: reply is not a JSON object")
+        except json.JSONDecodeError as exc:
+            errors.append(f"JSONDecodeError: {exc}")
+    return ChunkResult(text, False, errors, time.perf_counter() - start)
+
+
+def translate_chunks(chunks: List[str], language: str, url: str = GEMMA_URL,
+                     concurrency: int = CONCURRENCY, retries: int = RETRIES,
+                     timeout: Optional[float] = REQUEST_TIMEOUT,
+                     verbose: bool = True) -> Iterator[ChunkResult]:
+    """Translate *chunks* with up to *concurrency* requests in flight, yielding results in order."""
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        yield from pool.map(
+            lambda chunk: translate_chunk(chunk, language, url, retries, timeout, verbose), chunks
+        )
+
 
 def main() -> None:
+    from tqdm import tqdm
 
     print("Sleeping for 2")
     time.sleep(60 * 60 * 2)
 
     for language in ["Simplified Chinese", "Japanese", "Polish", "Swedish", "Korean", "Ukrainian", "Dutch", "Turkish", "Vietnamese"]:
 
-        CHUNKS_DIR = os.path.join(os.path.dirname(__file__), "..", "chunks")
-        OUT_DIR   = os.path.join(os.path.dirname(__file__), "..", "translated_chunks", language.lower())
+        OUT_DIR = os.path.join(TRANSLATED_CHUNKS_DIR, language.lower())
         os.makedirs(OUT_DIR, exist_ok=True)
 
         files = [f for f in os.listdir(CHUNKS_DIR) if f.lower().endswith(".json")]
@@ -102,24 +154,25 @@ def main() -> None:
             print("No .json files found in", CHUNKS_DIR)
             return
 
-        for fname in tqdm(files, desc="Translating files", unit="file"):
-            src_path = os.path.join(CHUNKS_DIR, fname)
-            with open(src_path, "r", encoding="utf-8") as f:
-                chunk_text = f.read()
+        chunk_texts = []
+        for fname in files:
+            with open(os.path.join(CHUNKS_DIR, fname), "r", encoding="utf-8") as f:
+                chunk_texts.append(f.read())
 
-            try:
-                translated_text = send_translation_request(chunk_text, language)
-            except Exception as exc:
-                print(f"\n❌ Error translating {fname}: {exc}")
+        results = translate_chunks(chunk_texts, language)
+        for fname, result in tqdm(zip(files, results), total=len(files),
+                                  desc="Translating files", unit="file"):
+            if result.text is None:
+                print(f"\n❌ Error translating {fname}: {result.errors[-1]}")
                 continue
 
             # Expect the model to return a well‑formed JSON string
-            try:
-                translated_obj = json.loads(translated_text)
-            except json.JSONDecodeError:
+            if result.ok:
+                translated_obj = json.loads(result.text)
+            else:
                 print(f"\n⚠️  Model output for {fname} wasn't valid JSON. "
                     "Saving raw text so you can inspect it.")
-                translated_obj = translated_text  # still save something
+                translated_obj = result.text  # still save something
 
             out_path = os.path.join(OUT_DIR, fname)
             with open(out_path, "w", encoding="utf-8") as out_f:
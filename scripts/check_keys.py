@@ -2,10 +2,15 @@
 
 import json
 import sys
-from pathlib import Path
 
-def load_json(path):
+from lang_files import LANGUAGES, SOURCE_LANGUAGE, load_language, resolve_language_arg
+
+def load_json(arg):
+    """Load a path or language code, going through the shared loader for language files."""
+    path, lang = resolve_language_arg(arg)
     try:
+        if lang is not None:
+            return load_language(lang)
         with open(path, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
@@ -27,15 +32,23 @@ def compare_keys(file1, file2):
         return True
 
 def main():
+    if len(sys.argv) == 1:
+        # No arguments: check every language against the source catalogue.
+        source = load_language(SOURCE_LANGUAGE)
+        ok = True
+        for lang in LANGUAGES:
+            if lang == SOURCE_LANGUAGE:
+                continue
+            print(f"[{lang}]")
+            ok = compare_keys(source, load_language(lang)) and ok
+        sys.exit(0 if ok else 1)
+
     if len(sys.argv) != 3:
-        print("Usage: check_keys.py <path_to_first_json> <path_to_second_json>")
+        print("Usage: check_keys.py [<path_or_lang_1> <path_or_lang_2>]")
         sys.exit(1)
 
-    path1 = Path(sys.argv[1])
-    path2 = Path(sys.argv[2])
-
-    json1 = load_json(path1)
-    json2 = load_json(path2)
+    json1 = load_json(sys.argv[1])
+    json2 = load_json(sys.argv[2])
 
     if not isinstance(json1, dict) or not isinstance(json2, dict):
         print("Both JSON files must contain a top-level object (dictionary).")
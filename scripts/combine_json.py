@@ -91,11 +91,15 @@ def main(folder: str, output: str = "combined.json") -> None:
     print(f"   Total keys: {len(combined)}")
 
 
-if __name__ == "__main__":
+def cli() -> None:
     if len(sys.argv) < 2:
         print("Usage: python combine_json.py <folder_path> [output_file]")
         sys.exit(1)
 
     folder_arg = sys.argv[1]
     output_arg = sys.argv[2] if len(sys.argv) > 2 else "combined.json"
-    main(folder_arg, output_arg)
\ No newline at end of file
+    main(folder_arg, output_arg)
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+dod_i18n.py - single entry point for the translation workflow scripts.
+
+Usage
+-----
+    python scripts/dod_i18n.py <command> [args...]
+
+Commands are looked up in COMMANDS and their module is only imported once it
+is actually chosen, so `check` never pays for boto3/requests/tqdm. Every
+script resolves paths from `lang_files.REPO_ROOT`, so this can be run from any
+directory.
+"""
+
+import importlib
+import sys
+from pathlib import Path
+
+# command -> (module, function, one-line help)
+COMMANDS = {
+    "sync":      ("download",           "main", "Download new submissions from S3 into recent_changes/."),
+    "review":    ("validate_changes",   "main", "Back-translate submissions and accept/deny them."),
+    "apply":     ("apply_changes",      "main", "Apply accepted submissions in passed_changes/."),
+    "watch":     ("watch",              "main", "Process new submissions continuously as they land."),
+    "extract":   ("find_L_in_lines",    "main", "Add new L(...) strings from the game source to es.json."),
+    "translate": ("auto_translate",     "main", "Batch-translate chunks/ with the local LLM."),
+    "mock-llm":  ("mock_llm",           "main", "Serve a fake streaming LLM for offline testing."),
+    "load-test": ("load_test",          "main", "Benchmark the translation client against the mock LLM."),
+    "check":     ("check_keys",         "main", "Report keys missing from a language file."),
+    "lengths":   ("length_budget",      "main", "Rank translations likely to overflow the UI."),
+    "split":     ("split_json",         "main", "Split a language file into fixed-size chunks."),
+    "combine":   ("combine_json",       "cli",  "Combine chunk_###.json files into one file."),
+}
+
+
+def usage() -> str:
+    lines = ["Usage: dod_i18n.py <command> [args...]", "", "Commands:"]
+    for name, (_, _, help_text) in COMMANDS.items():
+        lines.append(f"  {name:<10} {help_text}")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> None:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        sys.exit(0 if argv else 1)
+
+    command, rest = argv[0], argv[1:]
+    if command not in COMMANDS:
+        print(f"Unknown command '{command}'.\n")
+        print(usage())
+        sys.exit(1)
+
+    module_name, func_name, _ = COMMANDS[command]
+    # Subcommands read their own arguments from sys.argv.
+    sys.argv = [f"dod_i18n.py {command}"] + rest
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    module = importlib.import_module(module_name)
+    getattr(module, func_name)()
+
+
+if __name__ == "__main__":
+    main()
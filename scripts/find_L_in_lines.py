@@ -1,14 +1,20 @@
 #!/usr/bin/env python3
 from pathlib import Path
+import os
 import re
 import ast
 import json
 import shutil
+import sys
 from typing import Iterable, List
 
+from lang_files import forget_language, language_path, load_language
+
 # ---- CONFIGURABLE PATHS ----
-ROOT = Path("/Users/robertcordingly/Documents/Decks of Dexterity/DecksOfDexterity")
-TRANSLATIONS_JSON = Path("/Users/robertcordingly/Documents/Decks of Dexterity/Translations/Decks-of-Dexterity-Translations/es.json")
+# Game source checkout; override with DOD_GAME_ROOT or `dod_i18n.py extract <path>`.
+ROOT = Path(os.environ.get("DOD_GAME_ROOT", "/Users/robertcordingly/Documents/Decks of Dexterity/DecksOfDexterity"))
+TRANSLATIONS_LANG = "es"
+TRANSLATIONS_JSON = language_path(TRANSLATIONS_LANG)
 BACKUP_JSON = TRANSLATIONS_JSON.with_suffix(TRANSLATIONS_JSON.suffix + ".bak")
 PLACEHOLDER_VALUE = "MISSING TRANSLATION"
 # ----------------------------
@@ -52,14 +58,10 @@ def extract_strings_from_gml(root: Path) -> List[str]:
             print(f"# Skipped {gml_path} due to error: {e}")
     return dedup_preserve_order(found)
 
-def load_translations_dict(json_path: Path) -> dict:
-    if not json_path.exists():
+def load_translations_dict(lang: str) -> dict:
+    if not language_path(lang).exists():
         return {}
-    with json_path.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-        if not isinstance(data, dict):
-            raise ValueError("Translations JSON must be an object of key/value pairs.")
-        return data  # maintains insertion order in 3.7+
+    return load_language(lang)  # maintains insertion order in 3.7+
 
 # --- Minimal JSON-aware appender (preserves existing formatting) ---
 
@@ -181,11 +183,13 @@ def find_extra_keys(translations: dict, gml_strings: List[str]) -> List[str]:
     return [k for k in translations if k not in gml_set]
 
 def main():
+    root = Path(sys.argv[1]) if len(sys.argv) > 1 else ROOT
+
     # 1) Gather all first-arg strings from L(...) across .gml files
-    gml_strings = extract_strings_from_gml(ROOT)
+    gml_strings = extract_strings_from_gml(root)
 
     # 2) Load translations to know existing keys
-    translations = load_translations_dict(TRANSLATIONS_JSON)
+    translations = load_translations_dict(TRANSLATIONS_LANG)
     existing_keys = set(translations.keys())
 
     # 3) Determine missing keys (preserve discovery order)
@@ -203,6 +207,7 @@ def main():
     # 4) Save back, appending only new keys at end (no reformatting)
     if missing:
         save_with_backup_append(TRANSLATIONS_JSON, missing, PLACEHOLDER_VALUE)
+        forget_language(TRANSLATIONS_LANG)  # file was rewritten behind the cache
     else:
         print("# No new strings to add — translations already complete for discovered keys.")
 
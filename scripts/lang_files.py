@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+lang_files.py - shared repo paths and an in-process loader for language files.
+
+Every script used to hard-code `../passed_changes` and friends, so they only
+worked when run from inside `scripts/`. The repo root is now resolved once,
+from this file's location, and everything else is derived from it.
+
+Language files are cached after the first load so a command that touches the
+same catalogue several times (e.g. applying many patches to `es.json`) only
+parses it once.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+REPO_ROOT = Path(os.environ.get("DOD_I18N_ROOT", Path(__file__).resolve().parent.parent))
+
+RECENT_DIR = REPO_ROOT / "recent_changes"
+PASSED_DIR = REPO_ROOT / "passed_changes"
+DENIED_DIR = REPO_ROOT / "denied_changes"
+CHUNKS_DIR = REPO_ROOT / "chunks"
+TRANSLATED_CHUNKS_DIR = REPO_ROOT / "translated_chunks"
+# Names of passed_changes/ files whose edits have been saved to the language files.
+APPLIED_LEDGER = REPO_ROOT / "applied_changes.json"
+
+SOURCE_LANGUAGE = "en"
+
+# Language codes used by the game, i.e. `<code>.json` in the repo root.
+LANGUAGES = [
+    "en", "brpt", "cn", "de", "du", "es", "fr", "it",
+    "jp", "ko", "po", "ru", "sw", "tk", "uk", "vt",
+]
+
+_cache: Dict[str, dict] = {}
+
+
+def language_path(lang: str) -> Path:
+    return REPO_ROOT / f"{lang}.json"
+
+
+def resolve_language_arg(arg: str) -> Tuple[Path, Optional[str]]:
+    """Resolve a command-line argument that is either a path or a bare code such as `de`.
+
+    Returns the path and, if it is one of the repo's language files, its code.
+    """
+    path = Path(arg)
+    if not path.exists() and arg in LANGUAGES:
+        return language_path(arg), arg
+    for lang in LANGUAGES:
+        if path.exists() and path.resolve() == language_path(lang).resolve():
+            return path, lang
+    return path, None
+
+
+def load_language(lang: str) -> dict:
+    """Return the parsed `<lang>.json`, loading it on first use."""
+    if lang not in _cache:
+        with language_path(lang).open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            raise ValueError(f"{lang}.json must contain a top-level object.")
+        _cache[lang] = data
+    return _cache[lang]
+
+
+def save_language(lang: str) -> Path:
+    """Write the cached copy of `<lang>.json` back to disk."""
+    path = language_path(lang)
+    with path.open("w", encoding="utf-8") as f:
+        json.dump(_cache[lang], f, ensure_ascii=False, indent=4)
+    return path
+
+
+def forget_language(lang: str) -> None:
+    """Drop a cached language so the next load re-reads it from disk."""
+    _cache.pop(lang, None)
+
+
+def pending_patches(folder: Path) -> List[Path]:
+    """Sorted list of `*.json` submissions in *folder* (empty if it is missing)."""
+    if not folder.is_dir():
+        return []
+    return sorted(p for p in folder.iterdir() if p.suffix == ".json")
+
+
+def load_patch(path: Path) -> dict:
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_applied() -> Set[str]:
+    if not APPLIED_LEDGER.exists():
+        return set()
+    with APPLIED_LEDGER.open("r", encoding="utf-8") as f:
+        return set(json.load(f))
+
+
+def record_applied(names: Iterable[str]) -> None:
+    """Add *names* to the applied-patches ledger."""
+    applied = load_applied() | set(names)
+    with APPLIED_LEDGER.open("w", encoding="utf-8") as f:
+        json.dump(sorted(applied), f, ensure_ascii=False, indent=4)
+
+
+def validate_patch(patch) -> Optional[str]:
+    """Return why a submission is malformed, or None if it is well formed."""
+    if not isinstance(patch, dict):
+        return "submission must be a JSON object"
+    lang = patch.get("language")
+    if lang not in LANGUAGES:
+        return f"unknown language {lang!r}"
+    edits = patch.get("edits")
+    if not isinstance(edits, dict) or not edits:
+        return "no edits"
+    if not all(isinstance(v, str) for v in edits.values()):
+        return "edits must map strings to strings"
+    return None
+
+
+def iter_patches(folder: Path) -> Iterator[Tuple[Path, dict]]:
+    for path in pending_patches(folder):
+        yield path, load_patch(path)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+length_budget.py - find translations that are likely to overflow the UI.
+
+Every catalogue is aligned on the keys of `en.json` and the display length of
+each value is compared with the English one. Per language the log length
+ratios are turned into z-scores, so a string is flagged when it is unusually
+long *for that language* (German is expected to run longer than English;
+a German string three times the English one is not).
+
+Usage
+-----
+    python scripts/dod_i18n.py lengths [--top 40] [--z 3.0]
+    python scripts/dod_i18n.py lengths --max-lengths limits.json --glyph-widths font.json
+    python scripts/dod_i18n.py lengths --patch recent_changes/<id>.json
+
+* `--max-lengths` is a JSON object of `{key: max_length}`.
+* `--glyph-widths` is a JSON object of `{char: width, "default": width}`, or
+  one such table per language code (`{"en": {...}, "jp": {...}}`). Without
+  it, or when a language or `en` has no per-language table, every character
+  counts as 1 on both sides.
+* With `--patch` the incoming edits are measured against the catalogue
+  statistics instead; the exit status is 1 if any edit fails the budget or
+  the submission's language cannot be checked.
+
+Lengths are measured on the longest line (values use a literal `\\n` for line
+breaks), since that is what has to fit in a text box.
+
+Requires numpy (pip install numpy).
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from lang_files import LANGUAGES, SOURCE_LANGUAGE, load_language, load_patch, validate_patch
+
+Z_THRESHOLD_DEFAULT = 3.0
+TOP_DEFAULT = 40
+PLACEHOLDER_VALUE = "MISSING TRANSLATION"
+
+
+def line_width(text: str, glyphs: Optional[Dict[str, float]] = None) -> float:
+    """Display width of the longest line of *text*."""
+    lines = text.replace("\\n", "\n").split("\n")
+    if glyphs is None:
+        return float(max(len(line) for line in lines))
+    default = glyphs.get("default", 1.0)
+    return float(max(sum(glyphs.get(ch, default) for ch in line) for line in lines))
+
+
+def glyphs_for(tables: Optional[dict], lang: str) -> Tuple[Optional[Dict[str, float]], Optional[Dict[str, float]]]:
+    """Glyph tables to measure (*lang*, English) with.
+
+    Widths are only used when both sides have a table; otherwise both fall
+    back to character counts so the ratio never mixes the two units.
+    """
+    if not tables:
+        return None, None
+    if all(isinstance(v, dict) for v in tables.values()):
+        glyphs, en_glyphs = tables.get(lang), tables.get(SOURCE_LANGUAGE)
+        if glyphs is None or en_glyphs is None:
+            return None, None
+        return glyphs, en_glyphs
+    return tables, tables
+
+
+class Catalogue:
+    """Lengths of every language aligned on the English keys.
+
+    `lengths` and `english` have shape (len(langs), len(keys)); missing or
+    untranslated values are NaN. `english` is per row because each language
+    may be measured with a different glyph table. `ratios` is
+    `lengths / english`, and `mu`/`sigma` are the per-language mean and
+    standard deviation of the log ratios.
+    """
+
+    def __init__(self, langs: List[str] = LANGUAGES, glyph_tables: Optional[dict] = None):
+        self.glyph_tables = glyph_tables
+        self.keys = list(load_language(SOURCE_LANGUAGE))
+        self.langs = [lang for lang in langs if lang != SOURCE_LANGUAGE]
+
+        english = load_language(SOURCE_LANGUAGE)
+        english_by_table = {}
+        self.english = np.empty((len(self.langs), len(self.keys)))
+        self.lengths = np.full((len(self.langs), len(self.keys)), np.nan)
+        for row, lang in enumerate(self.langs):
+            data = load_language(lang)
+            glyphs, en_glyphs = glyphs_for(glyph_tables, lang)
+            table_id = id(en_glyphs)
+            if table_id not in english_by_table:
+                english_by_table[table_id] = np.array(
+                    [line_width(english[k] or k, en_glyphs) for k in self.keys], dtype=float
+                )
+            self.english[row] = english_by_table[table_id]
+            for col, key in enumerate(self.keys):
+                value = data.get(key)
+                if isinstance(value, str) and value and value != PLACEHOLDER_VALUE:
+                    self.lengths[row, col] = line_width(value, glyphs)
+
+        self.english[self.english == 0] = np.nan
+        self.ratios = self.lengths / self.english
+        with np.errstate(divide="ignore"):
+            log_ratios = np.log(self.ratios)
+        log_ratios[~np.isfinite(log_ratios)] = np.nan
+        self.mu = np.nanmean(log_ratios, axis=1)
+        self.sigma = np.nanstd(log_ratios, axis=1)
+        self.sigma[self.sigma == 0] = np.nan
+        self.z = (log_ratios - self.mu[:, None]) / self.sigma[:, None]
+
+    def zscore(self, lang: str, length: float, english: float) -> float:
+        row = self.langs.index(lang)
+        if not english:
+            return float("nan")
+        return float((np.log(length / english) - self.mu[row]) / self.sigma[row])
+
+    def summary(self) -> List[dict]:
+        rows = []
+        for row, lang in enumerate(self.langs):
+            r = self.ratios[row]
+            r = r[np.isfinite(r)]
+            if r.size == 0:
+                continue
+            p50, p90, p99 = np.percentile(r, [50, 90, 99])
+            rows.append({
+                "language": lang,
+                "values": int(r.size),
+                "total": float(np.nansum(self.lengths[row]) / np.nansum(self.english[row][np.isfinite(self.lengths[row])])),
+                "p50": float(p50),
+                "p90": float(p90),
+                "p99": float(p99),
+            })
+        return rows
+
+    def overflows(self, z_threshold: float, max_lengths: Optional[Dict[str, float]] = None) -> List[dict]:
+        """Rank (language, key) pairs that are outliers or exceed a hard limit."""
+        flagged = np.nan_to_num(self.z, nan=-np.inf) > z_threshold
+        limits = None
+        if max_lengths:
+            limits = np.array([max_lengths.get(k, np.inf) for k in self.keys], dtype=float)
+            flagged |= np.nan_to_num(self.lengths, nan=-np.inf) > limits[None, :]
+
+        rows, cols = np.nonzero(flagged)
+        # Hard-limit violations first, then by z-score.
+        over = (self.lengths[rows, cols] > limits[cols]) if limits is not None else np.zeros(len(rows), bool)
+        order = np.lexsort((-np.nan_to_num(self.z[rows, cols], nan=0.0), ~over))
+
+        report = []
+        for i in order:
+            row, col = rows[i], cols[i]
+            report.append({
+                "language": self.langs[row],
+                "key": self.keys[col],
+                "english": float(self.english[row, col]),
+                "length": float(self.lengths[row, col]),
+                "ratio": float(self.ratios[row, col]),
+                "z": float(self.z[row, col]),
+                "limit": float(limits[col]) if limits is not None and np.isfinite(limits[col]) else None,
+            })
+        return report
+
+
+def check_patch(patch: dict, catalogue: Catalogue, z_threshold: float = Z_THRESHOLD_DEFAULT,
+                max_lengths: Optional[Dict[str, float]] = None) -> List[str]:
+    """Return a list of budget problems for one submission (empty if it passes)."""
+    problem = validate_patch(patch)
+    if problem:
+        return [problem]
+    lang = patch["language"]
+    if lang not in catalogue.langs:
+        return [f"unknown language {lang!r}"]
+    if not np.isfinite(catalogue.sigma[catalogue.langs.index(lang)]):
+        return [f"no length statistics for {lang!r} to check against"]
+
+    english = load_language(SOURCE_LANGUAGE)
+    glyphs, en_glyphs = glyphs_for(catalogue.glyph_tables, lang)
+
+    problems = []
+    for key, value in patch["edits"].items():
+        if key not in english or not value:
+            continue
+        length = line_width(value, glyphs)
+        en_length = line_width(english[key] or key, en_glyphs)
+        limit = (max_lengths or {}).get(key)
+        if limit is not None and length > limit:
+            problems.append(f"{key!r}: length {length:g} exceeds limit {limit:g}")
+            continue
+        z = catalogue.zscore(lang, length, en_length)
+        if not np.isfinite(z):
+            problems.append(f"{key!r}: cannot score {length:g} vs {en_length:g} in English")
+        elif z > z_threshold:
+            problems.append(f"{key!r}: {length:g} vs {en_length:g} in English (z={z:.1f})")
+    return problems
+
+
+def load_optional_json(path: Optional[Path]) -> Optional[dict]:
+    if path is None:
+        return None
+    with path.open(encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report translations likely to overflow the UI.")
+    parser.add_argument("--z", type=float, default=Z_THRESHOLD_DEFAULT,
+                        help=f"Flag strings this many standard deviations above their language (default {Z_THRESHOLD_DEFAULT}).")
+    parser.add_argument("--top", type=int, default=TOP_DEFAULT,
+                        help=f"Number of overflow rows to print (default {TOP_DEFAULT}, 0 for all).")
+    parser.add_argument("--max-lengths", type=Path, help="JSON object of {key: max_length}.")
+    parser.add_argument("--glyph-widths", type=Path, help="JSON glyph width table, optionally per language.")
+    parser.add_argument("--patch", type=Path, nargs="+", help="Check submission file(s) instead of the catalogue.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    max_lengths = load_optional_json(args.max_lengths)
+    catalogue = Catalogue(glyph_tables=load_optional_json(args.glyph_widths))
+
+    if args.patch:
+        failed = False
+        for path in args.patch:
+            try:
+                problems = check_patch(load_patch(path), catalogue, args.z, max_lengths)
+            except (OSError, ValueError) as exc:  # includes JSON and Unicode decode errors
+                problems = [f"unreadable ({exc.__class__.__name__}: {exc})"]
+            if problems:
+                failed = True
+                print(f"{path.name}: {len(problems)} problem(s)")
+                for problem in problems:
+                    print(f"  {problem}")
+            else:
+                print(f"{path.name}: OK")
+        sys.exit(1 if failed else 0)
+
+    print(f"{'lang':<6}{'values':>8}{'total':>8}{'p50':>7}{'p90':>7}{'p99':>7}")
+    for row in catalogue.summary():
+        print(f"{row['language']:<6}{row['values']:>8}{row['total']:>8.2f}"
+              f"{row['p50']:>7.2f}{row['p90']:>7.2f}{row['p99']:>7.2f}")
+
+    report = catalogue.overflows(args.z, max_lengths)
+    print(f"\n{len(report)} string(s) over budget (z > {args.z:g}"
+          f"{' or over max length' if max_lengths else ''}):")
+    for entry in report[:args.top or None]:
+        limit = f" limit {entry['limit']:g}" if entry["limit"] is not None else ""
+        print(f"  [{entry['language']}] x{entry['ratio']:.2f} z={entry['z']:.1f}"
+              f" ({entry['length']:g} vs {entry['english']:g}{limit})  {entry['key']!r}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+load_test.py - measure the translation client against the mock LLM server.
+
+Splits `en.json` into chunks and sends them through
+`auto_translate.translate_chunks` - the same retry and concurrency code
+`auto_translate.py` uses - for every combination of chunk size, concurrency
+and retry count given on the command line. A chunk counts as translated once
+a reply parses as a JSON object.
+
+Usage
+-----
+    python scripts/dod_i18n.py load-test --sizes 50,200 --concurrency 1,4 --retries 0,2
+    python scripts/dod_i18n.py load-test --error-rate 0.1 --malformed-rate 0.05 --seed 1
+    python scripts/dod_i18n.py load-test --url http://localhost:1234/v1/chat/completions
+
+Without `--url` a mock server is started in-process with the given
+`--tokens-per-sec`, `--ttft`, `--error-rate` and `--malformed-rate`.
+
+`ok keys/s` counts only keys in chunks that were translated; `sent keys/s`
+counts every key sent. Failed attempts are summarised by exception type
+below each row.
+
+Requires requests (pip install requests).
+"""
+
+import argparse
+import json
+import time
+from collections import Counter
+from typing import List, Tuple
+
+from auto_translate import translate_chunks
+from lang_files import SOURCE_LANGUAGE, load_language
+from mock_llm import (
+    TOKENS_PER_SEC_DEFAULT, TTFT_DEFAULT, MockConfig, completions_url, fraction,
+    non_negative_float, positive_float, start_in_thread,
+)
+
+KEYS_DEFAULT = 800
+TIMEOUT_DEFAULT = 120.0
+LANGUAGE = "German"
+
+
+def positive_int(text: str) -> int:
+    """argparse type for counts that must be > 0."""
+    value = int(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"must be > 0, got {text}")
+    return value
+
+
+def positive_int_list(text: str) -> List[int]:
+    """argparse type for comma-separated sizes and worker counts (each > 0)."""
+    values = [positive_int(x) for x in text.split(",") if x]
+    if not values:
+        raise argparse.ArgumentTypeError("expected at least one value")
+    return values
+
+
+def non_negative_int_list(text: str) -> List[int]:
+    """argparse type for comma-separated retry counts (each >= 0)."""
+    values = [int(x) for x in text.split(",") if x]
+    if not values or any(v < 0 for v in values):
+        raise argparse.ArgumentTypeError(f"expected values >= 0, got {text}")
+    return values
+
+
+def make_chunks(keys: int, size: int) -> List[Tuple[str, int]]:
+    """(chunk JSON, number of keys in it) for the first *keys* English strings."""
+    english = load_language(SOURCE_LANGUAGE)
+    items = list(english.items())[:keys]
+    return [
+        (json.dumps(dict(items[i:i + size]), ensure_ascii=False, indent=2), len(items[i:i + size]))
+        for i in range(0, len(items), size)
+    ]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run(url: str, keys: int, size: int, concurrency: int, retries: int, timeout: float) -> dict:
+    chunks = make_chunks(keys, size)
+    start = time.perf_counter()
+    results = list(translate_chunks([text for text, _ in chunks], LANGUAGE, url=url,
+                                    concurrency=concurrency, retries=retries,
+                                    timeout=timeout, verbose=False))
+    elapsed = time.perf_counter() - start
+
+    sent_keys = sum(n for _, n in chunks)
+    ok_keys = sum(n for (_, n), result in zip(chunks, results) if result.ok)
+    errors = Counter(error.split(":", 1)[0] for result in results for error in result.errors)
+    latencies = [result.seconds for result in results]
+    return {
+        "size": size,
+        "concurrency": concurrency,
+        "retries": retries,
+        "chunks": len(chunks),
+        "ok": sum(1 for result in results if result.ok),
+        "attempts": sum(len(result.errors) + result.ok for result in results),
+        "ok_keys_per_sec": ok_keys / elapsed if elapsed else float("nan"),
+        "sent_keys_per_sec": sent_keys / elapsed if elapsed else float("nan"),
+        "p50": percentile(latencies, 50),
+        "p95": percentile(latencies, 95),
+        "p99": percentile(latencies, 99),
+        "elapsed": elapsed,
+        "errors": errors,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Load-test the translation client.")
+    parser.add_argument("--url", help="Target server; a mock server is started if omitted.")
+    parser.add_argument("--keys", type=positive_int, default=KEYS_DEFAULT,
+                        help=f"Number of en.json keys to send per configuration (default {KEYS_DEFAULT}).")
+    parser.add_argument("--sizes", type=positive_int_list, default=[100, 400], help="Comma-separated chunk sizes.")
+    parser.add_argument("--concurrency", type=positive_int_list, default=[1, 4], help="Comma-separated worker counts.")
+    parser.add_argument("--retries", type=non_negative_int_list, default=[0, 2], help="Comma-separated retry counts.")
+    parser.add_argument("--timeout", type=positive_float, default=TIMEOUT_DEFAULT,
+                        help=f"Per-request timeout in seconds (default {TIMEOUT_DEFAULT:g}).")
+    parser.add_argument("--tokens-per-sec", type=positive_float, default=TOKENS_PER_SEC_DEFAULT)
+    parser.add_argument("--ttft", type=non_negative_float, default=TTFT_DEFAULT)
+    parser.add_argument("--error-rate", type=fraction, default=0.0)
+    parser.add_argument("--malformed-rate", type=fraction, default=0.0)
+    parser.add_argument("--seed", type=int)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+
+    server = None
+    url = args.url
+    if url is None:
+        config = MockConfig(args.tokens_per_sec, args.ttft, args.error_rate, args.malformed_rate, args.seed)
+        server = start_in_thread(config)
+        url = completions_url(server)
+    print(f"Target: {url}  (up to {args.keys} keys per run)\n")
+
+    print(f"{'size':>5}{'conc':>6}{'retry':>6}{'ok':>10}{'tries':>7}{'ok keys/s':>11}{'sent keys/s':>13}"
+          f"{'p50 s':>8}{'p95 s':>8}{'p99 s':>8}{'total s':>9}")
+    try:
+        for size in args.sizes:
+            for concurrency in args.concurrency:
+                for retries in args.retries:
+                    r = run(url, args.keys, size, concurrency, retries, args.timeout)
+                    print(f"{r['size']:>5}{r['concurrency']:>6}{r['retries']:>6}"
+                          f"{r['ok']:>5}/{r['chunks']:<4}{r['attempts']:>7}"
+                          f"{r['ok_keys_per_sec']:>11.1f}{r['sent_keys_per_sec']:>13.1f}"
+                          f"{r['p50']:>8.2f}{r['p95']:>8.2f}{r['p99']:>8.2f}{r['elapsed']:>9.2f}")
+                    if r["errors"]:
+                        print("      failed attempts: " + ", ".join(
+                            f"{name} x{count}" for name, count in r["errors"].most_common()))
+    finally:
+        if server is not None:
+            server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
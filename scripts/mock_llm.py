@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+mock_llm.py - stand-in for the local Gemma server used by auto_translate.py.
+
+Serves an OpenAI-compatible `POST /v1/chat/completions` that streams its
+reply as server-sent events (`data: {...}` chunks ending with
+`data: [DONE]`). The "translation" simply echoes the keys of the JSON in the
+user message back as the values, so the client sees a well-formed reply of
+realistic size.
+
+Failure modes can be injected to exercise the client:
+
+* `--error-rate`      fraction of requests answered with HTTP 500.
+* `--malformed-rate`  fraction of replies whose JSON is cut off before the end.
+
+Usage
+-----
+    python scripts/dod_i18n.py mock-llm [--port 1234] [--tokens-per-sec 2000] [--ttft 0.2]
+
+Only the standard library is needed.
+"""
+
+import argparse
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Iterator, Optional
+
+PORT_DEFAULT = 1234
+TOKENS_PER_SEC_DEFAULT = 2000.0
+TTFT_DEFAULT = 0.2
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class MockConfig:
+    tokens_per_sec: float = TOKENS_PER_SEC_DEFAULT
+    ttft: float = TTFT_DEFAULT
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+    seed: Optional[int] = None
+
+
+def echo_translation(user_content: str) -> str:
+    """Reply with every key of the submitted JSON mapped to itself."""
+    try:
+        data = json.loads(user_content)
+    except json.JSONDecodeError:
+        return user_content
+    if not isinstance(data, dict):
+        return user_content
+    return json.dumps({k: k for k in data}, ensure_ascii=False, indent=2)
+
+
+def tokenize(text: str) -> Iterator[str]:
+    for i in range(0, len(text), CHARS_PER_TOKEN):
+        yield text[i:i + CHARS_PER_TOKEN]
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    config = MockConfig()
+    rng = random.Random()
+    rng_lock = threading.Lock()
+
+    def log_message(self, format, *args):  # keep load tests quiet
+        pass
+
+    def roll(self, rate: float) -> bool:
+        with self.rng_lock:
+            return self.rng.random() < rate
+
+    def send_json(self, status: int, obj: dict) -> None:
+        payload = json.dumps(obj).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        if self.path.rstrip("/") != "/v1/chat/completions":
+            self.send_error(404)
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(body, dict):
+                raise ValueError("request body must be a JSON object")
+        except ValueError as exc:
+            self.send_json(400, {"error": {"message": f"bad request: {exc}"}})
+            return
+
+        if self.roll(self.config.error_rate):
+            self.send_json(500, {"error": {"message": "injected failure"}})
+            return
+
+        messages = body.get("messages")
+        user_messages = [
+            m["content"] for m in (messages if isinstance(messages, list) else [])
+            if isinstance(m, dict) and m.get("role") == "user" and isinstance(m.get("content"), str)
+        ]
+        reply = echo_translation(user_messages[-1] if user_messages else "")
+        if self.roll(self.config.malformed_rate):
+            reply = reply[: max(1, len(reply) * 2 // 3)]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+
+        model = body.get("model", "mock")
+        time.sleep(self.config.ttft)
+        start = time.monotonic()
+        try:
+            for i, token in enumerate(tokenize(reply)):
+                # Pace against the start time so small sleeps don't accumulate drift.
+                ahead = start + i / self.config.tokens_per_sec - time.monotonic()
+                if ahead > 0.001:
+                    time.sleep(ahead)
+                event = {"model": model, "choices": [{"index": 0, "delta": {"content": token}}]}
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def positive_float(text: str) -> float:
+    """argparse type for rates that must be > 0."""
+    value = float(text)
+    if not value > 0:
+        raise argparse.ArgumentTypeError(f"must be > 0, got {text}")
+    return value
+
+
+def non_negative_float(text: str) -> float:
+    """argparse type for delays that must be >= 0."""
+    value = float(text)
+    if not value >= 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {text}")
+    return value
+
+
+def fraction(text: str) -> float:
+    """argparse type for probabilities between 0 and 1."""
+    value = float(text)
+    if not 0 <= value <= 1:
+        raise argparse.ArgumentTypeError(f"must be between 0 and 1, got {text}")
+    return value
+
+
+def make_server(config: MockConfig, host: str = "127.0.0.1", port: int = PORT_DEFAULT) -> ThreadingHTTPServer:
+    """Create (but don't start) a mock server; port 0 picks a free port."""
+    handler = type("ConfiguredMockHandler", (MockHandler,), {
+        "config": config,
+        "rng": random.Random(config.seed),
+        "rng_lock": threading.Lock(),
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def start_in_thread(config: MockConfig) -> ThreadingHTTPServer:
+    """Start a mock server on a free port in a background thread."""
+    server = make_server(config, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def completions_url(server: ThreadingHTTPServer) -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}/v1/chat/completions"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run a mock OpenAI-compatible streaming server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT_DEFAULT, help=f"Port (default {PORT_DEFAULT}).")
+    parser.add_argument("--tokens-per-sec", type=positive_float, default=TOKENS_PER_SEC_DEFAULT,
+                        help=f"Streaming rate per request (default {TOKENS_PER_SEC_DEFAULT:g}).")
+    parser.add_argument("--ttft", type=non_negative_float, default=TTFT_DEFAULT,
+                        help=f"Seconds before the first token (default {TTFT_DEFAULT:g}).")
+    parser.add_argument("--error-rate", type=fraction, default=0.0, help="Fraction of requests that get HTTP 500.")
+    parser.add_argument("--malformed-rate", type=fraction, default=0.0, help="Fraction of replies with truncated JSON.")
+    parser.add_argument("--seed", type=int, help="Seed for the failure injection.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    config = MockConfig(args.tokens_per_sec, args.ttft, args.error_rate, args.malformed_rate, args.seed)
+    server = make_server(config, args.host, args.port)
+    print(f"Mock LLM listening on {completions_url(server)} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
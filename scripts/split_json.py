@@ -4,7 +4,10 @@ Split a flat JSON object into N‑key chunks (default 400 keys per file).
 
 Example
 -------
-$ python split_json_chunks.py strings.json --outdir ./chunks --size 400
+$ python split_json.py en --outdir ./chunks --size 400
+
+Chunks go to the repo's `chunks/` (where `auto_translate.py` reads them) unless
+--outdir is given.
 """
 
 import argparse
@@ -13,17 +16,19 @@ import math
 import os
 from pathlib import Path
 
+from lang_files import CHUNKS_DIR, load_language, resolve_language_arg
+
 CHUNK_SIZE_DEFAULT = 400
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Split a JSON dict into fixed‑size chunks.")
-    parser.add_argument("infile", type=Path, help="Path to the source JSON file.")
+    parser.add_argument("infile", help="Path to the source JSON file, or a language code such as `en`.")
     parser.add_argument(
         "--outdir",
         type=Path,
-        default=Path("./chunks"),
-        help="Directory to write the chunk files (created if missing).",
+        default=CHUNKS_DIR,
+        help=f"Directory to write the chunk files (created if missing; default {CHUNKS_DIR}).",
     )
     parser.add_argument(
         "--size",
@@ -40,7 +45,10 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
-def load_json(path: Path) -> dict:
+def load_json(arg: str) -> dict:
+    path, lang = resolve_language_arg(arg)
+    if lang is not None:
+        return load_language(lang)
     with path.open(encoding="utf-8") as f:
         data = json.load(f)
     if not isinstance(data, dict):
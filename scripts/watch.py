@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+watch.py - long-running watch mode for incoming translation submissions.
+
+Polls `recent_changes/` and `passed_changes/` and handles each new file once:
+
+* recent_changes/  -> validated (known language, non-empty edits, optional
+  length budget). Invalid submissions are moved to `denied_changes/`; valid
+  ones are queued for review, either inline with `--review` or later with
+  `dod_i18n.py review`.
+* passed_changes/  -> applied to the language file kept in memory. Changed
+  languages are written back once no new change has arrived for `--debounce`
+  seconds.
+
+Patches are recorded in `applied_changes.json` once their language file has
+been saved (`dod_i18n.py apply` records them too). Anything in
+`passed_changes/` that is not in that ledger at startup is applied, so
+submissions accepted while the watcher was stopped are not missed.
+A submission that still does not parse once it has stopped changing is
+treated as malformed. Errors while handling a single file are logged and the
+watcher carries on.
+
+Usage
+-----
+    python scripts/dod_i18n.py watch [--interval 2] [--debounce 5] [--review] [--budget]
+    python scripts/dod_i18n.py watch --sync-every 300
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Set
+
+from apply_changes import apply_patch
+from lang_files import (
+    DENIED_DIR, PASSED_DIR, RECENT_DIR,
+    forget_language, language_path, load_applied, load_language, load_patch,
+    record_applied, save_language, validate_patch,
+)
+
+INTERVAL_DEFAULT = 2.0
+DEBOUNCE_DEFAULT = 5.0
+
+
+def scan(folder: Path) -> Dict[str, float]:
+    """Map of `*.json` file name -> mtime for *folder*."""
+    if not folder.is_dir():
+        return {}
+    with os.scandir(folder) as it:
+        return {e.name: e.stat().st_mtime for e in it if e.is_file() and e.name.endswith(".json")}
+
+
+def deny(path: Path, reason: str) -> None:
+    os.makedirs(DENIED_DIR, exist_ok=True)
+    os.rename(path, DENIED_DIR / path.name)
+    print(f"✗ {path.name}: {reason}; moved to denied_changes.")
+
+
+class Watcher:
+    def __init__(self, debounce: float = DEBOUNCE_DEFAULT, review: bool = False, budget: bool = False):
+        self.debounce = debounce
+        self.review = review
+        self.catalogue = None
+        if budget:
+            from length_budget import Catalogue
+            self.catalogue = Catalogue()
+
+        self.queued: Set[str] = set()
+        # handled this run, or recorded in the ledger by an earlier run
+        self.applied: Set[str] = load_applied()
+        # applied since the last flush; recorded in the ledger once their languages are saved
+        self.unrecorded: Set[str] = set()
+        # mtime of files that did not parse yet, to tell "still being written" from "broken"
+        self.unparsed: Dict[Path, float] = {}
+        self.dirty: Set[str] = set()
+        self.last_change = 0.0
+        # mtime of each resident language file when we last read or wrote it
+        self.loaded_mtime: Dict[str, float] = {}
+        # edits applied to each dirty language since it was last saved
+        self.pending: Dict[str, List[dict]] = {}
+
+    def read(self, path: Path, mtime: float):
+        """Load a submission, or return None if it is not readable yet.
+
+        Raises ValueError once a file that does not parse has stopped changing.
+        """
+        try:
+            patch = load_patch(path)
+        except json.JSONDecodeError as exc:
+            if self.unparsed.get(path) == mtime:
+                del self.unparsed[path]
+                raise ValueError(f"invalid JSON ({exc})") from exc
+            self.unparsed[path] = mtime  # probably still being written; retry on the next poll
+            return None
+        except (UnicodeDecodeError, OSError) as exc:
+            self.unparsed.pop(path, None)
+            raise ValueError(f"unreadable ({exc.__class__.__name__}: {exc})") from exc
+        self.unparsed.pop(path, None)
+        return patch
+
+    # ── recent_changes ─────────────────────────────────────────────────────
+    def intake(self, path: Path, mtime: float) -> None:
+        try:
+            patch = self.read(path, mtime)
+        except ValueError as exc:
+            self.queued.add(path.name)
+            deny(path, str(exc))
+            return
+        if patch is None:
+            return
+        self.queued.add(path.name)
+
+        problem = validate_patch(patch)
+        if problem:
+            deny(path, problem)
+            return
+
+        if self.catalogue is not None:
+            from length_budget import check_patch
+            for warning in check_patch(patch, self.catalogue):
+                print(f"  ⚠️  {path.name}: {warning}")
+
+        print(f"→ {path.name} ({patch['language']}, {len(patch['edits'])} edits) queued for review.")
+        if self.review:
+            from validate_changes import review_file
+            review_file(path)
+
+    # ── passed_changes ─────────────────────────────────────────────────────
+    def resident(self, lang: str) -> dict:
+        """Language data kept in memory, reloaded only if the file changed on disk."""
+        mtime = language_path(lang).stat().st_mtime
+        if self.loaded_mtime.get(lang) != mtime and lang not in self.dirty:
+            forget_language(lang)
+            self.loaded_mtime[lang] = mtime
+        return load_language(lang)
+
+    def apply(self, path: Path, mtime: float) -> None:
+        try:
+            patch = self.read(path, mtime)
+        except ValueError as exc:
+            self.applied.add(path.name)
+            print(f"✗ {path.name}: {exc}; not applied.")
+            return
+        if patch is None:
+            return
+        self.applied.add(path.name)
+
+        problem = validate_patch(patch)
+        if problem:
+            print(f"✗ {path.name}: {problem}; not applied.")
+            return
+
+        lang = patch["language"]
+        if not language_path(lang).exists():
+            print(f"Language file not found for '{lang}': {language_path(lang)}")
+            return
+
+        updated = apply_patch(self.resident(lang), patch["edits"])
+        if updated:
+            self.dirty.add(lang)
+            self.pending.setdefault(lang, []).append(patch["edits"])
+        self.unrecorded.add(path.name)
+        self.last_change = time.monotonic()
+        print(f"✓ {path.name}: {updated} update(s) to {lang}.json")
+
+    def flush(self, force: bool = False) -> None:
+        if not self.dirty and not self.unrecorded:
+            return
+        if not force and time.monotonic() - self.last_change < self.debounce:
+            return
+        for lang in sorted(self.dirty):
+            if language_path(lang).stat().st_mtime != self.loaded_mtime.get(lang):
+                # Changed on disk since we loaded it (git pull, manual apply...):
+                # start from the new file and replay our edits instead of overwriting it.
+                print(f"⚠️  {lang}.json changed on disk; re-applying {len(self.pending[lang])} pending patch(es) on top.")
+                forget_language(lang)
+                self.loaded_mtime[lang] = language_path(lang).stat().st_mtime
+                data = load_language(lang)
+                for edits in self.pending[lang]:
+                    apply_patch(data, edits)
+            path = save_language(lang)
+            self.loaded_mtime[lang] = path.stat().st_mtime
+            print(f"Saved {path}")
+        self.dirty.clear()
+        self.pending.clear()
+        record_applied(self.unrecorded)
+        self.unrecorded.clear()
+
+    def poll(self) -> None:
+        for name, mtime in sorted(scan(RECENT_DIR).items()):
+            if name not in self.queued:
+                self.guarded(self.intake, RECENT_DIR / name, mtime)
+        for name, mtime in sorted(scan(PASSED_DIR).items()):
+            if name not in self.applied:
+                self.guarded(self.apply, PASSED_DIR / name, mtime)
+        self.guarded(self.flush)
+
+    @staticmethod
+    def guarded(func, *args) -> None:
+        """Run one step, logging instead of raising so the watcher keeps going."""
+        try:
+            func(*args)
+        except Exception as exc:
+            print(f"❌ {func.__name__}{tuple(str(a) for a in args)} failed: {exc.__class__.__name__}: {exc}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Watch for new submissions and process them as they land.")
+    parser.add_argument("--interval", type=float, default=INTERVAL_DEFAULT,
+                        help=f"Seconds between polls (default {INTERVAL_DEFAULT:g}).")
+    parser.add_argument("--debounce", type=float, default=DEBOUNCE_DEFAULT,
+                        help=f"Seconds without changes before language files are saved (default {DEBOUNCE_DEFAULT:g}).")
+    parser.add_argument("--review", action="store_true",
+                        help="Review each valid submission interactively as it arrives.")
+    parser.add_argument("--budget", action="store_true",
+                        help="Warn about strings that fail the length budget (requires numpy).")
+    parser.add_argument("--sync-every", type=float, default=0,
+                        help="Also download new submissions from S3 every N seconds (0 = never).")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    watcher = Watcher(debounce=args.debounce, review=args.review, budget=args.budget)
+    next_sync = 0.0
+    print(f"Watching {RECENT_DIR} and {PASSED_DIR} (Ctrl+C to stop)")
+    try:
+        while True:
+            if args.sync_every and time.monotonic() >= next_sync:
+                try:
+                    import download
+                    download.main()
+                except Exception as exc:
+                    print(f"❌ Sync failed, retrying in {args.sync_every:g}s: {exc.__class__.__name__}: {exc}")
+                next_sync = time.monotonic() + args.sync_every
+            watcher.poll()
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.flush(force=True)
+
+
+if __name__ == "__main__":
+    main()